@@ -5,17 +5,46 @@ These examples show how to extend the AlertHandler base class
 to implement custom alerting mechanisms.
 """
 
+import atexit
+import logging
 import os
 import json
 import smtplib
 from email.mime.text import MIMEText
 from typing import Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
 # Uncomment imports as needed:
-# import requests  # For Slack/Discord webhooks
 # from twilio.rest import Client  # For SMS alerts
 
-from uptime_checker import AlertHandler, CheckResult
+from uptime_checker import AlertHandler, CheckResult, Status
+
+logger = logging.getLogger(__name__)
+
+# Shared by all webhook handlers so alerts reuse pooled HTTPS connections
+# instead of opening a fresh connection (and TLS handshake) per request.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _json_value(value) -> bytes:
+    """Encode a single value as JSON for substitution into a payload template."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
 
 
 class EmailAlertHandler(AlertHandler):
@@ -38,23 +67,23 @@ class EmailAlertHandler(AlertHandler):
         self.from_email = os.environ.get('ALERT_EMAIL_FROM')
         self.to_email = os.environ.get('ALERT_EMAIL_TO')
     
-    def on_status_change(self, result: CheckResult, previous_status: Optional[str]) -> None:
-        if result.status == 'down':
+    def on_status_change(self, result: CheckResult, previous_status: Optional[Status]) -> None:
+        if result.status is Status.DOWN:
             subject = f"ALERT: {result.url} is DOWN"
             body = f"""
 Site: {result.url}
 Status: DOWN
 Previous Status: {previous_status}
 Error: {result.error_message or f'HTTP {result.status_code}'}
-Time: {result.timestamp.isoformat()}
+Time: {result.timestamp_iso}
 """
-        elif result.status == 'up' and previous_status == 'down':
+        elif result.status is Status.UP and previous_status is Status.DOWN:
             subject = f"RECOVERED: {result.url} is back UP"
             body = f"""
 Site: {result.url}
 Status: UP
 Response Time: {result.response_time_ms:.2f}ms
-Time: {result.timestamp.isoformat()}
+Time: {result.timestamp_iso}
 """
         else:
             return  # No email for other state changes
@@ -63,7 +92,7 @@ Time: {result.timestamp.isoformat()}
     
     def _send_email(self, subject: str, body: str) -> None:
         if not all([self.smtp_user, self.smtp_password, self.from_email, self.to_email]):
-            print("Email alert skipped: Missing SMTP configuration")
+            logger.warning("Email alert skipped: Missing SMTP configuration")
             return
         
         msg = MIMEText(body)
@@ -76,8 +105,9 @@ Time: {result.timestamp.isoformat()}
                 server.starttls()
                 server.login(self.smtp_user, self.smtp_password)
                 server.send_message(msg)
-        except Exception as e:
-            print(f"Failed to send email alert: {e}")
+        except (smtplib.SMTPException, OSError) as e:
+            # Tracebacks only at DEBUG; expected failures log one line
+            logger.warning(f"Failed to send email alert: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
 
 
 class SlackAlertHandler(AlertHandler):
@@ -87,44 +117,47 @@ class SlackAlertHandler(AlertHandler):
     - SLACK_WEBHOOK_URL: Slack incoming webhook URL
     """
     
+    # Payloads have a fixed shape, so they are rendered from byte templates
+    # with JSON-encoded values (see _json_value) substituted in.
+    _DOWN_TEMPLATE = (
+        b'{"attachments":[{"color":"danger","text":%b,"fields":['
+        b'{"title":"Error","value":%b,"short":true},'
+        b'{"title":"Previous Status","value":%b,"short":true}],"ts":%b}]}'
+    )
+    _UP_TEMPLATE = (
+        b'{"attachments":[{"color":"good","text":%b,"fields":['
+        b'{"title":"Response Time","value":%b,"short":true}],"ts":%b}]}'
+    )
+    
     def __init__(self):
         self.webhook_url = os.environ.get('SLACK_WEBHOOK_URL')
+        self.session = _SESSION
     
-    def on_status_change(self, result: CheckResult, previous_status: Optional[str]) -> None:
+    def on_status_change(self, result: CheckResult, previous_status: Optional[Status]) -> None:
         if not self.webhook_url:
-            print("Slack alert skipped: Missing SLACK_WEBHOOK_URL")
+            logger.warning("Slack alert skipped: Missing SLACK_WEBHOOK_URL")
             return
         
-        if result.status == 'down':
-            color = 'danger'
-            text = f":x: *{result.url}* is DOWN"
-            fields = [
-                {"title": "Error", "value": result.error_message or f"HTTP {result.status_code}", "short": True},
-                {"title": "Previous Status", "value": previous_status or "unknown", "short": True}
-            ]
-        elif result.status == 'up' and previous_status == 'down':
-            color = 'good'
-            text = f":white_check_mark: *{result.url}* is back UP"
-            fields = [
-                {"title": "Response Time", "value": f"{result.response_time_ms:.2f}ms", "short": True}
-            ]
+        if result.status is Status.DOWN:
+            body = self._DOWN_TEMPLATE % (
+                _json_value(f":x: *{result.url}* is DOWN"),
+                _json_value(result.error_message or f"HTTP {result.status_code}"),
+                _json_value(previous_status or "unknown"),
+                _json_value(result.ts_ns / 1e9)
+            )
+        elif result.status is Status.UP and previous_status is Status.DOWN:
+            body = self._UP_TEMPLATE % (
+                _json_value(f":white_check_mark: *{result.url}* is back UP"),
+                _json_value(f"{result.response_time_ms:.2f}ms"),
+                _json_value(result.ts_ns / 1e9)
+            )
         else:
             return
         
-        payload = {
-            "attachments": [{
-                "color": color,
-                "text": text,
-                "fields": fields,
-                "ts": result.timestamp.timestamp()
-            }]
-        }
-        
         try:
-            import requests
-            requests.post(self.webhook_url, json=payload, timeout=10)
-        except Exception as e:
-            print(f"Failed to send Slack alert: {e}")
+            self.session.post(self.webhook_url, data=body, headers=_JSON_HEADERS, timeout=10)
+        except requests.RequestException as e:
+            logger.warning(f"Failed to send Slack alert: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
 
 
 class DiscordAlertHandler(AlertHandler):
@@ -134,39 +167,39 @@ class DiscordAlertHandler(AlertHandler):
     - DISCORD_WEBHOOK_URL: Discord webhook URL
     """
     
+    _TEMPLATE = b'{"embeds":[{"title":%b,"description":%b,"color":%d,"timestamp":%b}]}'
+    
     def __init__(self):
         self.webhook_url = os.environ.get('DISCORD_WEBHOOK_URL')
+        self.session = _SESSION
     
-    def on_status_change(self, result: CheckResult, previous_status: Optional[str]) -> None:
+    def on_status_change(self, result: CheckResult, previous_status: Optional[Status]) -> None:
         if not self.webhook_url:
-            print("Discord alert skipped: Missing DISCORD_WEBHOOK_URL")
+            logger.warning("Discord alert skipped: Missing DISCORD_WEBHOOK_URL")
             return
         
-        if result.status == 'down':
+        if result.status is Status.DOWN:
             color = 15158332  # Red
             title = f"ALERT: {result.url} is DOWN"
             description = f"Error: {result.error_message or f'HTTP {result.status_code}'}"
-        elif result.status == 'up' and previous_status == 'down':
+        elif result.status is Status.UP and previous_status is Status.DOWN:
             color = 3066993  # Green
             title = f"RECOVERED: {result.url} is back UP"
             description = f"Response time: {result.response_time_ms:.2f}ms"
         else:
             return
         
-        payload = {
-            "embeds": [{
-                "title": title,
-                "description": description,
-                "color": color,
-                "timestamp": result.timestamp.isoformat()
-            }]
-        }
+        body = self._TEMPLATE % (
+            _json_value(title),
+            _json_value(description),
+            color,
+            _json_value(result.timestamp_iso)
+        )
         
         try:
-            import requests
-            requests.post(self.webhook_url, json=payload, timeout=10)
-        except Exception as e:
-            print(f"Failed to send Discord alert: {e}")
+            self.session.post(self.webhook_url, data=body, headers=_JSON_HEADERS, timeout=10)
+        except requests.RequestException as e:
+            logger.warning(f"Failed to send Discord alert: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
 
 
 class PagerDutyAlertHandler(AlertHandler):
@@ -176,49 +209,77 @@ class PagerDutyAlertHandler(AlertHandler):
     - PAGERDUTY_ROUTING_KEY: PagerDuty Events API v2 routing key
     """
     
+    _TRIGGER_TEMPLATE = (
+        b'{"routing_key":%b,"event_action":"trigger","dedup_key":%b,'
+        b'"payload":{"summary":%b,"source":"uptime-checker","severity":"critical",'
+        b'"custom_details":%b}}'
+    )
+    _RESOLVE_TEMPLATE = b'{"routing_key":%b,"event_action":"resolve","dedup_key":%b}'
+    
     def __init__(self):
         self.routing_key = os.environ.get('PAGERDUTY_ROUTING_KEY')
         self.api_url = "https://events.pagerduty.com/v2/enqueue"
+        self.session = _SESSION
     
-    def on_status_change(self, result: CheckResult, previous_status: Optional[str]) -> None:
+    def on_status_change(self, result: CheckResult, previous_status: Optional[Status]) -> None:
         if not self.routing_key:
-            print("PagerDuty alert skipped: Missing PAGERDUTY_ROUTING_KEY")
+            logger.warning("PagerDuty alert skipped: Missing PAGERDUTY_ROUTING_KEY")
             return
         
-        if result.status == 'down':
-            payload = {
-                "routing_key": self.routing_key,
-                "event_action": "trigger",
-                "dedup_key": f"uptime-{result.url}",
-                "payload": {
-                    "summary": f"{result.url} is DOWN: {result.error_message or f'HTTP {result.status_code}'}",
-                    "source": "uptime-checker",
-                    "severity": "critical",
-                    "custom_details": result.to_dict()
-                }
-            }
-        elif result.status == 'up' and previous_status == 'down':
-            payload = {
-                "routing_key": self.routing_key,
-                "event_action": "resolve",
-                "dedup_key": f"uptime-{result.url}"
-            }
+        routing_key_json = _json_value(self.routing_key)
+        if result.status is Status.DOWN:
+            body = self._TRIGGER_TEMPLATE % (
+                routing_key_json,
+                _json_value(f"uptime-{result.url}"),
+                _json_value(f"{result.url} is DOWN: {result.error_message or f'HTTP {result.status_code}'}"),
+                result.to_json_bytes()
+            )
+        elif result.status is Status.UP and previous_status is Status.DOWN:
+            body = self._RESOLVE_TEMPLATE % (
+                routing_key_json,
+                _json_value(f"uptime-{result.url}")
+            )
         else:
             return
         
         try:
-            import requests
-            requests.post(self.api_url, json=payload, timeout=10)
-        except Exception as e:
-            print(f"Failed to send PagerDuty alert: {e}")
+            self.session.post(self.api_url, data=body, headers=_JSON_HEADERS, timeout=10)
+        except requests.RequestException as e:
+            logger.warning(f"Failed to send PagerDuty alert: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
 
 
 class FileAlertHandler(AlertHandler):
-    """Log all check results to a JSON file for later analysis."""
+    """Log all check results to a JSON file for later analysis.
+    
+    The file is opened once and written through a buffer. It is flushed every
+    `flush_every_n` results and on exit; raise `flush_every_n` to batch writes
+    when monitoring many sites, and set `fsync` to force each flush to disk.
+    """
     
-    def __init__(self, filepath: str = "uptime_history.jsonl"):
+    def __init__(self, filepath: str = "uptime_history.jsonl", flush_every_n: int = 1, fsync: bool = False):
         self.filepath = filepath
+        self.flush_every_n = max(1, flush_every_n)
+        self.fsync = fsync
+        self._unflushed = 0
+        self._fh = open(filepath, 'ab', buffering=1 << 16)
+        atexit.register(self.close)
     
     def on_check_complete(self, result: CheckResult) -> None:
-        with open(self.filepath, 'a') as f:
-            f.write(json.dumps(result.to_dict()) + '\n')
+        self._fh.write(result.to_json_bytes() + b'\n')
+        
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every_n:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write buffered results to the file."""
+        self._fh.flush()
+        if self.fsync:
+            os.fsync(self._fh.fileno())
+        self._unflushed = 0
+    
+    def close(self) -> None:
+        """Flush and close the history file."""
+        if not self._fh.closed:
+            self.flush()
+            self._fh.close()
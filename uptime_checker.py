@@ -3,17 +3,36 @@
 Uptime Checker - Web availability monitoring service
 """
 
+import heapq
+import itertools
 import json
 import logging
+import queue
+import socket
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 from urllib.parse import urlparse
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Configure logging
 logging.basicConfig(
@@ -26,45 +45,150 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued check results handed to alert handlers at once.
+ALERT_BATCH_SIZE = 100
+
+# GET bodies up to this size are read so their connection can be reused.
+MAX_DRAIN_BYTES = 64 * 1024
+
+
+class DNSCache:
+    """Time-limited cache in front of socket.getaddrinfo.
+    
+    Repeated checks of the same hosts then skip the resolver round-trip
+    until the entry expires. Only successful lookups are cached.
+    """
+    
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._getaddrinfo = socket.getaddrinfo
+        self._entries: dict[tuple, tuple[float, list]] = {}
+        self._lock = threading.Lock()
+    
+    def getaddrinfo(self, *args, **kwargs) -> list:
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        addresses = self._getaddrinfo(*args, **kwargs)
+        
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                if len(self._entries) >= self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + self.ttl, addresses)
+        
+        return addresses
+    
+    def install(self) -> None:
+        """Route all socket.getaddrinfo lookups in this process through the cache."""
+        socket.getaddrinfo = self.getaddrinfo
+
+
+_dns_cache: Optional[DNSCache] = None
+
+
+def enable_dns_cache(ttl: float) -> None:
+    """Cache DNS lookups process-wide for `ttl` seconds."""
+    global _dns_cache
+    if _dns_cache is None:
+        _dns_cache = DNSCache(ttl)
+        _dns_cache.install()
+    else:
+        _dns_cache.ttl = ttl
+
+
+class Status(str, Enum):
+    """Outcome of a check.
+    
+    Members are singletons, so code can compare with `is`; as a str subclass
+    they still compare equal to the plain strings 'up', 'down' and 'error'.
+    """
+    UP = 'up'
+    DOWN = 'down'
+    ERROR = 'error'
+    
+    __str__ = str.__str__
+
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a site availability check."""
     url: str
-    status: str  # 'up', 'down', 'error'
+    status: Status
     status_code: Optional[int]
     response_time_ms: Optional[float]
     error_message: Optional[str]
-    timestamp: datetime
-
+    ts_ns: int  # Wall-clock time of the check, from time.time_ns()
+    _iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        if type(self.status) is not Status:
+            self.status = Status(self.status)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local time of the check."""
+        seconds, nanos = divmod(self.ts_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 form of the timestamp, formatted once on first use."""
+        if self._iso is None:
+            self._iso = self.timestamp.isoformat()
+        return self._iso
+    
     def to_dict(self) -> dict:
         return {
             'url': self.url,
-            'status': self.status,
+            'status': self.status.value,
             'status_code': self.status_code,
             'response_time_ms': self.response_time_ms,
             'error_message': self.error_message,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp_iso
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON with the same fields as to_dict."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(',', ':')).encode()
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteConfig:
     """Configuration for a site to monitor."""
     url: str
     name: Optional[str] = None
     timeout: Optional[float] = None
     expected_status: int = 200
+    method: str = 'HEAD'  # 'HEAD' or 'GET'
+    interval: Optional[float] = None  # Overrides the global check interval
+    _display_name: str = field(default='', init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        method = self.method.upper() if isinstance(self.method, str) else None
+        if method not in ('HEAD', 'GET'):
+            raise ValueError(f"Invalid method for site {self.url}: {self.method!r} (expected 'HEAD' or 'GET')")
+        self.method = method
+        self._display_name = self.name or urlparse(self.url).netloc
     
     @property
     def display_name(self) -> str:
-        return self.name or urlparse(self.url).netloc
+        return self._display_name
 
 
 class AlertHandler:
     """Base class for alert handlers. Extend this to add custom alerting."""
     
-    def on_status_change(self, result: CheckResult, previous_status: Optional[str]) -> None:
+    def on_status_change(self, result: CheckResult, previous_status: Optional[Status]) -> None:
         """Called when a site's status changes (up -> down or down -> up)."""
         pass
     
@@ -76,20 +200,29 @@ class AlertHandler:
 class LoggingAlertHandler(AlertHandler):
     """Default alert handler that logs status changes."""
     
-    def on_status_change(self, result: CheckResult, previous_status: Optional[str]) -> None:
-        if result.status == 'down':
+    def on_status_change(self, result: CheckResult, previous_status: Optional[Status]) -> None:
+        if result.status is Status.DOWN:
             logger.warning(
                 f"ALERT: {result.url} is DOWN! "
                 f"Previous status: {previous_status}, "
                 f"Error: {result.error_message or f'HTTP {result.status_code}'}"
             )
-        elif result.status == 'up' and previous_status == 'down':
+        elif result.status is Status.UP and previous_status is Status.DOWN:
             logger.info(
                 f"RECOVERED: {result.url} is back UP! "
                 f"Response time: {result.response_time_ms:.2f}ms"
             )
 
 
+@lru_cache(maxsize=None)
+def _overridden_hooks(handler_type: type) -> tuple[bool, bool]:
+    """Return whether a handler class overrides (on_check_complete, on_status_change)."""
+    return (
+        handler_type.on_check_complete is not AlertHandler.on_check_complete,
+        handler_type.on_status_change is not AlertHandler.on_status_change
+    )
+
+
 class UptimeChecker:
     """Main uptime monitoring service."""
     
@@ -98,7 +231,51 @@ class UptimeChecker:
         self.config = self._load_config()
         self.sites = self._parse_sites()
         self.alert_handlers: list[AlertHandler] = [LoggingAlertHandler()]
-        self._previous_status: dict[str, str] = {}
+        # (snapshot of alert_handlers, [(handler, wants_complete, wants_change)],
+        #  whether any handler wants every check), rebuilt when the list changes
+        self._dispatch_cache: tuple[list, list, bool] = ([], [], False)
+        self._previous_status: dict[str, Status] = {}
+        
+        # Number of checks in flight at once; checks are I/O bound, so large
+        # site lists can raise this well beyond the CPU count.
+        self.max_workers = int(self.config.get('max_workers', min(32, len(self.sites)) or 1))
+        if self.max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {self.max_workers}")
+        
+        dns_cache_ttl = float(self.config.get('dns_cache_ttl', 0))
+        if dns_cache_ttl:
+            enable_dns_cache(dns_cache_ttl)
+        
+        # One pooled session shared by all checks so keep-alive connections
+        # and TLS sessions are reused between runs.
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'UptimeChecker/1.0'
+        adapter = HTTPAdapter(
+            pool_connections=max(1, len(self.sites)),
+            pool_maxsize=self.max_workers
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Checks currently running, so concurrent callers checking the same
+        # site wait on one request instead of issuing their own.
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Alert handlers run on a background thread fed by this queue, so a
+        # slow webhook never delays the next round of checks.
+        self._alert_q: queue.Queue = queue.Queue(maxsize=10_000)
+        self._alert_executor = ThreadPoolExecutor(
+            max_workers=8,
+            thread_name_prefix='uptime-alert'
+        )
+        self._alert_thread = threading.Thread(
+            target=self._alert_worker,
+            name='uptime-alert-queue',
+            daemon=True
+        )
+        self._alert_thread.start()
     
     def _load_config(self) -> dict:
         """Load configuration from JSON or YAML file."""
@@ -108,13 +285,13 @@ class UptimeChecker:
         content = self.config_path.read_text()
         
         if self.config_path.suffix in ['.yaml', '.yml']:
-            return yaml.safe_load(content)
+            return yaml.load(content, Loader=YamlLoader)
         elif self.config_path.suffix == '.json':
             return json.loads(content)
         else:
             # Try YAML first, then JSON
             try:
-                return yaml.safe_load(content)
+                return yaml.load(content, Loader=YamlLoader)
             except yaml.YAMLError:
                 return json.loads(content)
     
@@ -131,7 +308,9 @@ class UptimeChecker:
                     url=site_data['url'],
                     name=site_data.get('name'),
                     timeout=site_data.get('timeout', default_timeout),
-                    expected_status=site_data.get('expected_status', 200)
+                    expected_status=site_data.get('expected_status', 200),
+                    method=site_data.get('method', 'HEAD'),
+                    interval=site_data.get('interval')
                 ))
         
         return sites
@@ -141,114 +320,337 @@ class UptimeChecker:
         self.alert_handlers.append(handler)
     
     def check_site(self, site: SiteConfig) -> CheckResult:
-        """Check availability of a single site."""
-        start_time = time.time()
+        """Check availability of a single site.
+        
+        If the same site is already being checked on another thread, wait
+        for that check and return its result instead of sending a second
+        request. Every caller sharing a check receives the same result object.
+        """
+        return self._check_site_shared(site)[0]
+    
+    def _check_site_shared(self, site: SiteConfig) -> tuple[CheckResult, bool]:
+        """Check a site, joining an identical in-flight check if there is one.
+        
+        Returns the result and whether this call performed the request; only
+        that caller should trigger alerts, so a shared result is handled once.
+        """
+        key = (site.url, site.expected_status, site.method, site.timeout)
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result(), False
         
         try:
-            response = requests.get(
+            result = self._check_site(site)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _fetch_status(self, site: SiteConfig) -> tuple[int, float]:
+        """Request a site and return its HTTP status code and response time in ms.
+        
+        Small GET bodies are read so the connection goes back to the pool;
+        larger or unknown-length bodies are skipped and the connection dropped.
+        """
+        if site.method == 'HEAD':
+            start_time = time.perf_counter()
+            response = self.session.head(
                 site.url,
                 timeout=site.timeout,
-                headers={'User-Agent': 'UptimeChecker/1.0'},
                 allow_redirects=True
             )
+            response_time_ms = (time.perf_counter() - start_time) * 1000
+            response.close()
+            # Some servers reject HEAD outright; retry those with GET
+            if response.status_code not in (405, 501):
+                return response.status_code, response_time_ms
+        
+        start_time = time.perf_counter()
+        response = self.session.get(
+            site.url,
+            timeout=site.timeout,
+            allow_redirects=True,
+            stream=True
+        )
+        response_time_ms = (time.perf_counter() - start_time) * 1000
+        
+        try:
+            content_length = int(response.headers.get('Content-Length', ''))
+        except ValueError:
+            content_length = None
+        if content_length is not None and content_length <= MAX_DRAIN_BYTES:
+            response.content  # Fully read responses release their connection
+        response.close()
+        
+        return response.status_code, response_time_ms
+    
+    def _check_site(self, site: SiteConfig) -> CheckResult:
+        """Perform the HTTP request for a single site check."""
+        try:
+            status_code, response_time_ms = self._fetch_status(site)
             
-            response_time_ms = (time.time() - start_time) * 1000
-            
-            if response.status_code == site.expected_status:
-                status = 'up'
+            if status_code == site.expected_status:
+                status = Status.UP
                 error_message = None
             else:
-                status = 'down'
-                error_message = f"Unexpected status code: {response.status_code}"
+                status = Status.DOWN
+                error_message = f"Unexpected status code: {status_code}"
             
             result = CheckResult(
                 url=site.url,
                 status=status,
-                status_code=response.status_code,
+                status_code=status_code,
                 response_time_ms=response_time_ms,
                 error_message=error_message,
-                timestamp=datetime.now()
+                ts_ns=time.time_ns()
             )
             
         except requests.exceptions.Timeout:
             result = CheckResult(
                 url=site.url,
-                status='down',
+                status=Status.DOWN,
                 status_code=None,
                 response_time_ms=None,
                 error_message=f"Timeout after {site.timeout}s",
-                timestamp=datetime.now()
+                ts_ns=time.time_ns()
             )
         except requests.exceptions.ConnectionError as e:
             result = CheckResult(
                 url=site.url,
-                status='down',
+                status=Status.DOWN,
                 status_code=None,
                 response_time_ms=None,
                 error_message=f"Connection error: {str(e)[:100]}",
-                timestamp=datetime.now()
+                ts_ns=time.time_ns()
             )
         except requests.exceptions.RequestException as e:
             result = CheckResult(
                 url=site.url,
-                status='error',
+                status=Status.ERROR,
                 status_code=None,
                 response_time_ms=None,
                 error_message=f"Request error: {str(e)[:100]}",
-                timestamp=datetime.now()
+                ts_ns=time.time_ns()
             )
         
         return result
     
+    def _handler_dispatch(self) -> tuple[list[tuple[AlertHandler, bool, bool]], bool]:
+        """Return the handlers with hooks to call, and whether any wants every check.
+        
+        Recomputed only when alert_handlers has changed since the last call.
+        """
+        snapshot, dispatch, wants_every_check = self._dispatch_cache
+        if self.alert_handlers != snapshot:
+            snapshot = list(self.alert_handlers)
+            dispatch = [
+                (handler, *_overridden_hooks(type(handler)))
+                for handler in snapshot
+                if any(_overridden_hooks(type(handler)))
+            ]
+            wants_every_check = any(wants_complete for _, wants_complete, _ in dispatch)
+            # Replaced as one tuple so the alert worker never sees a partial update
+            self._dispatch_cache = (snapshot, dispatch, wants_every_check)
+        return dispatch, wants_every_check
+    
     def _trigger_alerts(self, result: CheckResult) -> None:
-        """Trigger alert handlers for a check result."""
+        """Queue a check result for the alert handlers."""
         previous_status = self._previous_status.get(result.url)
+        self._previous_status[result.url] = result.status
+        changed = previous_status is not result.status
+        
+        # Unchanged results only matter to handlers that want every check.
+        # Read the cache inline: this runs for every check.
+        if not changed:
+            snapshot, _, wants_every_check = self._dispatch_cache
+            if snapshot != self.alert_handlers:
+                wants_every_check = self._handler_dispatch()[1]
+            if not wants_every_check:
+                return
         
-        for handler in self.alert_handlers:
-            handler.on_check_complete(result)
+        item = (result, previous_status, changed)
+        try:
+            self._alert_q.put_nowait(item)
+        except queue.Full:
+            logger.warning("Alert queue is full, waiting for alert handlers to catch up")
+            self._alert_q.put(item)
+    
+    def _alert_worker(self) -> None:
+        """Drain queued results in batches and dispatch them to the handlers."""
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._alert_q.get()
+            # A None item is the shutdown sentinel queued by close()
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= ALERT_BATCH_SIZE:
+                    break
+                try:
+                    item = self._alert_q.get_nowait()
+                except queue.Empty:
+                    break
+            else:
+                stopping = True
             
-            if previous_status != result.status:
-                handler.on_status_change(result, previous_status)
+            # Handlers run concurrently with each other, but each one sees
+            # the batch in order so down/up transitions are never reordered.
+            futures = [
+                self._alert_executor.submit(self._run_handler, handler, wants_complete, wants_change, batch)
+                for handler, wants_complete, wants_change in self._handler_dispatch()[0]
+            ] if batch else []
+            wait(futures)
+            
+            for _ in range(len(batch) + stopping):
+                self._alert_q.task_done()
+    
+    def _run_handler(
+        self,
+        handler: AlertHandler,
+        wants_complete: bool,
+        wants_change: bool,
+        batch: list[tuple[CheckResult, Optional[Status], bool]]
+    ) -> None:
+        """Feed a batch of results to a single alert handler."""
+        for result, previous_status, changed in batch:
+            if wants_complete:
+                try:
+                    handler.on_check_complete(result)
+                except Exception:
+                    logger.exception(f"Alert handler {type(handler).__name__} failed")
+            
+            if changed and wants_change:
+                try:
+                    handler.on_status_change(result, previous_status)
+                except Exception:
+                    logger.exception(f"Alert handler {type(handler).__name__} failed")
+    
+    def flush_alerts(self) -> None:
+        """Block until every queued result has been handled."""
+        self._alert_q.join()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='uptime-check'
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """Deliver pending alerts, stop the worker threads and release pooled HTTP connections.
         
-        self._previous_status[result.url] = result.status
+        The checker cannot be used after it has been closed.
+        """
+        if self._alert_thread.is_alive():
+            self._alert_q.put(None)
+            self._alert_thread.join()
+            self._alert_executor.shutdown(wait=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+    
+    def _log_result(self, site: SiteConfig, result: CheckResult) -> None:
+        """Log the outcome of a single check."""
+        if result.status is Status.UP:
+            logger.info(
+                f"  ✓ {site.display_name}: UP - "
+                f"HTTP {result.status_code} in {result.response_time_ms:.2f}ms"
+            )
+        else:
+            logger.warning(
+                f"  ✗ {site.display_name}: {result.status.upper()} - "
+                f"{result.error_message}"
+            )
     
     def check_all(self) -> list[CheckResult]:
-        """Check all configured sites."""
+        """Check all configured sites concurrently."""
         results = []
         
         for site in self.sites:
             logger.info(f"Checking {site.display_name} ({site.url})...")
-            result = self.check_site(site)
-            
-            # Log result
-            if result.status == 'up':
-                logger.info(
-                    f"  ✓ {site.display_name}: UP - "
-                    f"HTTP {result.status_code} in {result.response_time_ms:.2f}ms"
-                )
-            else:
-                logger.warning(
-                    f"  ✗ {site.display_name}: {result.status.upper()} - "
-                    f"{result.error_message}"
-                )
-            
-            self._trigger_alerts(result)
+        
+        # Checks run in parallel; alerts are triggered here on the calling
+        # thread since they update the shared previous-status map.
+        for site, (result, is_owner) in zip(self.sites, self._get_executor().map(self._check_site_shared, self.sites)):
+            self._log_result(site, result)
+            if is_owner:
+                self._trigger_alerts(result)
             results.append(result)
         
         return results
     
     def run_continuous(self, interval_seconds: int = 60) -> None:
-        """Run monitoring continuously with specified interval."""
+        """Run monitoring continuously with specified interval.
+        
+        Each site is scheduled on its own timer (its `interval`, or
+        `interval_seconds` by default). First checks are staggered across the
+        interval so requests are spread out instead of sent in one burst.
+        """
         logger.info(f"Starting continuous monitoring with {interval_seconds}s interval")
         logger.info(f"Monitoring {len(self.sites)} sites")
         
+        if not self.sites:
+            return
+        
+        executor = self._get_executor()
+        sequence = itertools.count()  # Tie-breaker so sites are never compared
+        start = time.monotonic()
+        schedule = [
+            (start + i * (site.interval or interval_seconds) / len(self.sites), next(sequence), site)
+            for i, site in enumerate(self.sites)
+        ]
+        heapq.heapify(schedule)
+        pending: dict[Future, tuple[float, SiteConfig]] = {}
+        
         try:
             while True:
-                self.check_all()
-                logger.info(f"Next check in {interval_seconds} seconds...")
-                time.sleep(interval_seconds)
+                now = time.monotonic()
+                while schedule and schedule[0][0] <= now:
+                    due, _, site = heapq.heappop(schedule)
+                    logger.info(f"Checking {site.display_name} ({site.url})...")
+                    pending[executor.submit(self._check_site_shared, site)] = (due, site)
+                
+                timeout = max(0.0, schedule[0][0] - now) if schedule else None
+                if pending:
+                    done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    time.sleep(timeout)
+                    done = set()
+                
+                # Sites are rescheduled only once their check finishes, so a
+                # slow site never has more than one check in flight.
+                for future in done:
+                    due, site = pending.pop(future)
+                    result, is_owner = future.result()
+                    self._log_result(site, result)
+                    if is_owner:
+                        self._trigger_alerts(result)
+                    
+                    interval = site.interval or interval_seconds
+                    next_due = due + interval
+                    if next_due < time.monotonic():
+                        # The check overran its interval; don't try to catch up
+                        next_due = time.monotonic() + interval
+                    heapq.heappush(schedule, (next_due, next(sequence), site))
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
+        finally:
+            self.close()
 
 
 def main():
@@ -280,7 +682,11 @@ def main():
         
         if args.once:
             results = checker.check_all()
-            print(json.dumps([r.to_dict() for r in results], indent=2))
+            checker.close()
+            if orjson is not None:
+                print(orjson.dumps([r.to_dict() for r in results], option=orjson.OPT_INDENT_2).decode())
+            else:
+                print(json.dumps([r.to_dict() for r in results], indent=2))
         else:
             checker.run_continuous(args.interval)
             